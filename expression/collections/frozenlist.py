@@ -72,10 +72,12 @@ class FrozenList(Generic[TSource]):
         >>> ys = empty.cons(1).cons(2).cons(3).cons(4).cons(5)
     """
 
+    __slots__ = ("value", "__weakref__")
+
     def __init__(self, value: Optional[Iterable[TSource]] = None) -> None:
         # Use composition instead of inheritance since generic tuples
         # are not suppored by mypy.
-        self.value: Tuple[TSource, ...] = tuple(value) if value else tuple()
+        self.value: Tuple[TSource, ...] = tuple(value) if value is not None else ()
 
     def match(self, pattern: Any) -> Any:
         case: Case[TSource] = Case(self)
@@ -132,10 +134,21 @@ class FrozenList(Generic[TSource]):
         """Pipe list through the given functions."""
         return pipe(self, *args)
 
-    def append(self, other: FrozenList[TSource]) -> FrozenList[TSource]:
-        """Append frozen list to end of the frozen list."""
+    def append(self, *others: FrozenList[TSource]) -> FrozenList[TSource]:
+        """Append frozen lists to end of the frozen list.
 
-        return FrozenList(self.value + other.value)
+        Appending copies the list, i.e. is O(N + M). To append several
+        lists, pass them all in one call instead of chaining `append`
+        calls so the accumulated prefix is only copied once.
+        """
+
+        if not others:
+            return self
+
+        if len(others) == 1:
+            return FrozenList(self.value + others[0].value)
+
+        return concat((self, *others))
 
     def choose(self, chooser: Callable[[TSource], Option[TResult]]) -> FrozenList[TResult]:
         """Choose items from the list.
@@ -152,15 +165,12 @@ class FrozenList(Generic[TSource]):
             function.
         """
 
-        def mapper(x: TSource) -> FrozenList[TResult]:
-            return FrozenList(chooser(x).to_seq())
-
-        return self.collect(mapper)
+        options = builtins.map(chooser, self.value)
+        return FrozenList(option.value for option in options if option is not Nothing)
 
     def collect(self, mapping: Callable[[TSource], FrozenList[TResult]]) -> FrozenList[TResult]:
         mapped = builtins.map(mapping, self.value)
-        xs = (y for x in mapped for y in x)
-        return FrozenList(xs)
+        return FrozenList(itertools.chain.from_iterable(mapped))
 
     def cons(self, element: TSource) -> FrozenList[TSource]:
         """Add element to front of list."""
@@ -171,7 +181,7 @@ class FrozenList(Generic[TSource]):
     def empty() -> FrozenList[TSource]:
         """Returns empty list."""
 
-        return FrozenList()
+        return empty
 
     def filter(self, predicate: Callable[[TSource], bool]) -> FrozenList[TSource]:
         """Filter list.
@@ -207,7 +217,25 @@ class FrozenList(Generic[TSource]):
             Partially applied fold function that takes the source list
             and returns the final state value.
         """
-        return functools.reduce(folder, self, state)
+        return functools.reduce(folder, self.value, state)
+
+    def fold_back(self, folder: Callable[[TSource, TState], TState], state: TState) -> TState:
+        """Applies a function to each element of the collection,
+        starting from the end, threading an accumulator argument through
+        the computation. If the input function is f and the elements are
+        i0...iN then computes f i0 (... (f iN s)...).
+
+        Args:
+            folder: The function to update the state given the input
+                elements.
+
+            state: The initial state.
+
+        Returns:
+            The state object after the folding function is applied to
+            each element of the list.
+        """
+        return functools.reduce(lambda acc, x: folder(x, acc), reversed(self.value), state)
 
     def forall(self, predicate: Callable[[TSource], bool]) -> bool:
         """Tests if all elements of the collection satisfy the given
@@ -219,7 +247,7 @@ class FrozenList(Generic[TSource]):
         Returns:
             True if all of the elements satisfy the predicate.
         """
-        return all(predicate(x) for x in self)
+        return all(builtins.map(predicate, self.value))
 
     def head(self) -> TSource:
         """Returns the first element of the list.
@@ -234,8 +262,10 @@ class FrozenList(Generic[TSource]):
             ValueError: Thrown when the list is empty.
         """
 
-        head, *_ = self
-        return head
+        if not self.value:
+            raise ValueError("List contains no elements")
+
+        return self.value[0]
 
     def indexed(self, start: int = 0) -> FrozenList[Tuple[int, TSource]]:
         """Returns a new list whose elements are the corresponding
@@ -264,7 +294,7 @@ class FrozenList(Generic[TSource]):
     def is_empty(self) -> bool:
         """Return `True` if list is empty."""
 
-        return not bool(self)
+        return not self.value
 
     def map(self, mapping: Callable[[TSource], TResult]) -> FrozenList[TResult]:
         """Map list.
@@ -280,7 +310,7 @@ class FrozenList(Generic[TSource]):
         Returns:
             The list of transformed elements.
         """
-        return FrozenList((*builtins.map(mapping, self),))
+        return FrozenList(builtins.map(mapping, self.value))
 
     def mapi(self, mapping: Callable[[int, TSource], TResult]) -> FrozenList[TResult]:
         """Map list with index.
@@ -297,17 +327,17 @@ class FrozenList(Generic[TSource]):
         Returns:
             The list of transformed elements.
         """
-        return FrozenList((*itertools.starmap(mapping, enumerate(self)),))
+        return FrozenList(itertools.starmap(mapping, enumerate(self.value)))
 
     @staticmethod
     def of(*args: TSource) -> FrozenList[TSource]:
         """Create list from a number of arguments."""
-        return FrozenList((*args,))
+        return FrozenList(args)
 
     @staticmethod
     def of_seq(xs: Iterable[TSource]) -> FrozenList[TSource]:
         """Create list from iterable sequence."""
-        return FrozenList((*xs,))
+        return FrozenList(xs)
 
     @staticmethod
     def of_option(option: Option[TSource]) -> FrozenList[TSource]:
@@ -345,16 +375,32 @@ class FrozenList(Generic[TSource]):
         Returns:
             The list after removing the first N elements.
         """
+        if count == 0:
+            return self
+
         return FrozenList(self.value[count:])
 
     def skip_last(self, count: int) -> FrozenList[TSource]:
-        return FrozenList(self.value[:-count])
+        """Returns the list after removing the last N elements.
+
+        Args:
+            count: The number of elements to skip.
+
+        Returns:
+            The list after removing the last N elements.
+        """
+        if count == 0:
+            return self
+
+        return FrozenList(self.value[: max(len(self.value) - count, 0)])
 
     def tail(self) -> FrozenList[TSource]:
         """Return tail of List."""
 
-        _, *tail = self.value
-        return FrozenList(tail)
+        if not self.value:
+            raise ValueError("List contains no elements")
+
+        return FrozenList(self.value[1:])
 
     def sort(self, reverse: bool = False) -> FrozenList[TSource]:
         """Sort list directly.
@@ -392,6 +438,9 @@ class FrozenList(Generic[TSource]):
         Returns:
             The result list.
         """
+        if count >= len(self.value):
+            return self
+
         return FrozenList(self.value[:count])
 
     def take_last(self, count: int) -> FrozenList[TSource]:
@@ -404,8 +453,19 @@ class FrozenList(Generic[TSource]):
         Returns:
             The result list.
         """
+        if count == 0:
+            return empty
+
         return FrozenList(self.value[-count:])
 
+    def to_seq(self) -> seq.Seq[TSource]:
+        """Returns a lazy sequence view of the list.
+
+        Returns:
+            A sequence over the elements of the list.
+        """
+        return seq.Seq(self.value)
+
     def try_head(self) -> Option[TSource]:
         """Returns the first element of the list, or None if the list is
         empty.
@@ -459,14 +519,21 @@ class FrozenList(Generic[TSource]):
         ...
 
     def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, slice):
+            return FrozenList(self.value[key])
         return self.value[key]
 
     def __iter__(self) -> Iterator[TSource]:
         return iter(self.value)
 
     def __eq__(self, o: Any) -> bool:
+        if isinstance(o, FrozenList):
+            return self.value == o.value
         return self.value == o
 
+    def __hash__(self) -> int:
+        return hash(self.value)
+
     def __len__(self) -> int:
         return len(self.value)
 
@@ -490,18 +557,33 @@ class FrozenList(Generic[TSource]):
         return str(self)
 
 
+def _append(source: FrozenList[TSource], other: FrozenList[TSource]) -> FrozenList[TSource]:
+    return source.append(other)
+
+
 def append(source: FrozenList[TSource]) -> Callable[[FrozenList[TSource]], FrozenList[TSource]]:
-    def _append(other: FrozenList[TSource]) -> FrozenList[TSource]:
-        return source.append(other)
+    return functools.partial(_append, source)
+
 
-    return _append
+def _choose(chooser: Callable[[TSource], Option[TResult]], source: FrozenList[TSource]) -> FrozenList[TResult]:
+    return source.choose(chooser)
 
 
 def choose(chooser: Callable[[TSource], Option[TResult]]) -> Callable[[FrozenList[TSource]], FrozenList[TResult]]:
-    def _choose(source: FrozenList[TSource]) -> FrozenList[TResult]:
-        return source.choose(chooser)
+    return functools.partial(_choose, chooser)
 
-    return _choose
+
+def _collect(mapping: Callable[[TSource], FrozenList[TResult]], source: FrozenList[TSource]) -> FrozenList[TResult]:
+    """For each element of the list, applies the given function.
+    Concatenates all the results and return the combined list.
+
+    Args:
+        source: The input list.
+
+    Returns:
+        The concatenation of the transformed sublists.
+    """
+    return source.collect(mapping)
 
 
 def collect(mapping: Callable[[TSource], FrozenList[TResult]]) -> Callable[[FrozenList[TSource]], FrozenList[TResult]]:
@@ -517,32 +599,17 @@ def collect(mapping: Callable[[TSource], FrozenList[TResult]]) -> Callable[[Froz
         list and returns the concatenation of the transformed sublists.
     """
 
-    def _collect(source: FrozenList[TSource]) -> FrozenList[TResult]:
-        """For each element of the list, applies the given function.
-        Concatenates all the results and return the combined list.
-
-        Args:
-            source: The input list.
-
-        Returns:
-            The concatenation of the transformed sublists.
-        """
-        return source.collect(mapping)
-
-    return _collect
+    return functools.partial(_collect, mapping)
 
 
 def concat(sources: Iterable[FrozenList[TSource]]) -> FrozenList[TSource]:
     """Concatenate sequence of FrozenList's"""
 
-    def reducer(t: FrozenList[TSource], s: FrozenList[TSource]) -> FrozenList[TSource]:
-        return t.append(s)
-
-    return pipe(sources, seq.fold(reducer, empty))
+    return FrozenList(itertools.chain.from_iterable(sources))
 
 
 def cons(head: TSource, tail: FrozenList[TSource]) -> FrozenList[TSource]:
-    return FrozenList((head, *tail))
+    return tail.cons(head)
 
 
 nil: FrozenList[Any] = FrozenList()
@@ -550,31 +617,32 @@ empty: FrozenList[Any] = nil
 """The empty list."""
 
 
-def filter(predicate: Callable[[TSource], bool]) -> Callable[[FrozenList[TSource]], FrozenList[TSource]]:
+def _filter(predicate: Callable[[TSource], bool], source: FrozenList[TSource]) -> FrozenList[TSource]:
     """Returns a new collection containing only the elements of the
     collection for which the given predicate returns `True`
 
     Args:
-        predicate: The function to test the input elements.
+        source: The input list.
 
     Returns:
-        Partially applied filter function.
+        A list containing only the elements that satisfy the
+        predicate.
     """
+    return source.filter(predicate)
 
-    def _filter(source: FrozenList[TSource]) -> FrozenList[TSource]:
-        """Returns a new collection containing only the elements of the
-        collection for which the given predicate returns `True`
 
-        Args:
-            source: The input list.
+def filter(predicate: Callable[[TSource], bool]) -> Callable[[FrozenList[TSource]], FrozenList[TSource]]:
+    """Returns a new collection containing only the elements of the
+    collection for which the given predicate returns `True`
 
-        Returns:
-            A list containing only the elements that satisfy the
-            predicate.
-        """
-        return source.filter(predicate)
+    Args:
+        predicate: The function to test the input elements.
 
-    return _filter
+    Returns:
+        Partially applied filter function.
+    """
+
+    return functools.partial(_filter, predicate)
 
 
 def fold(folder: Callable[[TState, TSource], TState], state: TState) -> Callable[[FrozenList[TSource]], TState]:
@@ -603,6 +671,28 @@ def fold(folder: Callable[[TState, TSource], TState], state: TState) -> Callable
     return _fold
 
 
+def fold_back(folder: Callable[[TSource, TState], TState], source: FrozenList[TSource]) -> Callable[[TState], TState]:
+    """Applies a function to each element of the collection, starting
+    from the end, threading an accumulator argument through the
+    computation. If the input function is f and the elements are i0...iN
+    then computes f i0 (... (f iN s)...)
+
+    Args:
+        folder: The function to update the state given the input
+            elements.
+        source: The input list.
+
+    Returns:
+        Partially applied fold_back function that takes the initial
+        state and returns the final state value.
+    """
+
+    def _fold_back(state: TState) -> TState:
+        return source.fold_back(folder, state)
+
+    return _fold_back
+
+
 def forall(predicate: Callable[[TSource], bool]) -> Callable[[FrozenList[TSource]], bool]:
     """Tests if all elements of the collection satisfy the given
     predicate.
@@ -667,6 +757,10 @@ def is_empty(source: FrozenList[Any]) -> bool:
     return source.is_empty()
 
 
+def _map(mapper: Callable[[TSource], TResult], source: FrozenList[TSource]) -> FrozenList[TResult]:
+    return source.map(mapper)
+
+
 def map(mapper: Callable[[TSource], TResult]) -> Callable[[FrozenList[TSource]], FrozenList[TResult]]:
     """Map list.
 
@@ -680,10 +774,7 @@ def map(mapper: Callable[[TSource], TResult]) -> Callable[[FrozenList[TSource]],
         The list of transformed elements.
     """
 
-    def _map(source: FrozenList[TSource]) -> FrozenList[TResult]:
-        return source.map(mapper)
-
-    return _map
+    return functools.partial(_map, mapper)
 
 
 def mapi(mapper: Callable[[int, TSource], TResult]) -> Callable[[FrozenList[TSource]], FrozenList[TResult]]:
@@ -710,18 +801,18 @@ def mapi(mapper: Callable[[int, TSource], TResult]) -> Callable[[FrozenList[TSou
 
 def of(*args: TSource) -> FrozenList[TSource]:
     """Create list from a number of arguments."""
-    return FrozenList((*args,))
+    return FrozenList(args)
 
 
 def of_seq(xs: Iterable[TSource]) -> FrozenList[TSource]:
     """Create list from iterable sequence."""
-    return FrozenList((*xs,))
+    return FrozenList(xs)
 
 
 def of_option(option: Option[TSource]) -> FrozenList[TSource]:
-    if isinstance(option, Some):
-        return singleton(cast(Some[TSource], option).value)
-    return empty
+    if option is Nothing:
+        return empty
+    return singleton(option.value)
 
 
 @overload
@@ -740,13 +831,17 @@ def range(start: int, stop: int, step: int) -> FrozenList[int]:
 
 
 def range(*args: int, **kw: int) -> FrozenList[int]:
-    return FrozenList((*builtins.range(*args, **kw),))
+    return FrozenList(builtins.range(*args, **kw))
 
 
 def singleton(value: TSource) -> FrozenList[TSource]:
     return FrozenList((value,))
 
 
+def _skip(count: int, source: FrozenList[TSource]) -> FrozenList[TSource]:
+    return source.skip(count)
+
+
 def skip(count: int) -> Callable[[FrozenList[TSource]], FrozenList[TSource]]:
     """Returns the list after removing the first N elements.
 
@@ -757,10 +852,11 @@ def skip(count: int) -> Callable[[FrozenList[TSource]], FrozenList[TSource]]:
         The list after removing the first N elements.
     """
 
-    def _skip(source: FrozenList[TSource]) -> FrozenList[TSource]:
-        return source.skip(count)
+    return functools.partial(_skip, count)
+
 
-    return _skip
+def _skip_last(count: int, source: FrozenList[TSource]) -> FrozenList[TSource]:
+    return source.skip_last(count)
 
 
 def skip_last(count: int) -> Callable[[FrozenList[TSource]], FrozenList[TSource]]:
@@ -773,10 +869,7 @@ def skip_last(count: int) -> Callable[[FrozenList[TSource]], FrozenList[TSource]
         The list after removing the last N elements.
     """
 
-    def _skip_last(source: FrozenList[TSource]) -> FrozenList[TSource]:
-        return source.skip_last(count)
-
-    return _skip_last
+    return functools.partial(_skip_last, count)
 
 
 def sort(reverse=False) -> Callable[[FrozenList[TSource]], FrozenList[TSource]]:
@@ -832,6 +925,10 @@ def tail(source: FrozenList[TSource]) -> FrozenList[TSource]:
     return source.tail()
 
 
+def _take(count: int, source: FrozenList[TSource]) -> FrozenList[TSource]:
+    return source.take(count)
+
+
 def take(count: int) -> Callable[[FrozenList[TSource]], FrozenList[TSource]]:
     """Returns the first N elements of the list.
 
@@ -842,10 +939,11 @@ def take(count: int) -> Callable[[FrozenList[TSource]], FrozenList[TSource]]:
         The result list.
     """
 
-    def _take(source: FrozenList[TSource]) -> FrozenList[TSource]:
-        return source.take(count)
+    return functools.partial(_take, count)
+
 
-    return _take
+def _take_last(count: int, source: FrozenList[TSource]) -> FrozenList[TSource]:
+    return source.take_last(count)
 
 
 def take_last(count: int) -> Callable[[FrozenList[TSource]], FrozenList[TSource]]:
@@ -859,10 +957,19 @@ def take_last(count: int) -> Callable[[FrozenList[TSource]], FrozenList[TSource]
         The result list.
     """
 
-    def _take(source: FrozenList[TSource]) -> FrozenList[TSource]:
-        return source.take_last(count)
+    return functools.partial(_take_last, count)
+
 
-    return _take
+def to_seq(source: FrozenList[TSource]) -> seq.Seq[TSource]:
+    """Returns a lazy sequence view of the list.
+
+    Args:
+        source: The input list.
+
+    Returns:
+        A sequence over the elements of the list.
+    """
+    return source.to_seq()
 
 
 def try_head(source: FrozenList[TSource]) -> Option[TSource]:
@@ -939,6 +1046,7 @@ __all__ = [
     "empty",
     "filter",
     "fold",
+    "fold_back",
     "head",
     "indexed",
     "item",
@@ -955,6 +1063,7 @@ __all__ = [
     "tail",
     "take",
     "take_last",
+    "to_seq",
     "try_head",
     "unfold",
     "zip",
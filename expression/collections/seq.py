@@ -30,6 +30,8 @@ from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional, T
 
 from expression.core import Case, Option, SupportsLessThan, identity, pipe
 
+from . import frozenlist
+
 if TYPE_CHECKING:
     from .frozenlist import FrozenList
 
@@ -820,9 +822,7 @@ def take(count: int) -> Callable[[Iterable[TSource]], Iterable[TSource]]:
 
 
 def to_list(source: Iterable[TSource]) -> "FrozenList[TSource]":
-    from .frozenlist import FrozenList
-
-    return FrozenList.of_seq(source)
+    return frozenlist.of_seq(source)
 
 
 def unfold(generator: Callable[[TState], Option[Tuple[TSource, TState]]]) -> Callable[[TState], Iterable[TSource]]:
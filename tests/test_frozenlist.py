@@ -1,7 +1,9 @@
 import functools
+import weakref
 from builtins import list as list
 from typing import Any, Callable, List, Tuple
 
+import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
@@ -49,6 +51,14 @@ def test_list_tail_tail_null_fluent():
     assert xs.tail().tail().is_empty()
 
 
+def test_list_head_tail_empty_raises():
+    with pytest.raises(ValueError):
+        frozenlist.empty.head()
+
+    with pytest.raises(ValueError):
+        frozenlist.empty.tail()
+
+
 def test_list_list_fluent():
     xs = frozenlist.empty.cons(empty.cons(42))
     assert 42 == xs.head().head()
@@ -61,6 +71,29 @@ def test_list_empty():
     assert pipe(xs, frozenlist.is_empty)
 
 
+@given(st.lists(st.integers()))
+def test_list_skip_take_noop_returns_self(xs: List[int]):
+    ys = frozenlist.of_seq(xs)
+
+    assert ys.skip(0) is ys
+    assert ys.take(len(ys)) is ys
+    assert ys.take(len(ys) + 1) is ys
+
+
+def test_list_empty_is_shared():
+    xs: FrozenList[int] = FrozenList.empty()
+
+    assert xs is frozenlist.empty
+    assert frozenlist.of(1, 2).take_last(0) is frozenlist.empty
+
+
+def test_list_slots():
+    xs = frozenlist.of(1)
+
+    assert not hasattr(xs, "__dict__")
+    assert weakref.ref(xs)() is xs
+
+
 def test_list_non_empty():
     xs = frozenlist.singleton(42)
     assert len(xs) == 1
@@ -74,6 +107,12 @@ def test_list_length(xs: List[int]):
     assert len(xs) == len(ys)
 
 
+@given(st.integers(), st.lists(st.integers()))
+def test_list_cons(x: int, xs: List[int]):
+    ys = frozenlist.cons(x, frozenlist.of_seq(xs))
+    assert list(ys) == [x] + xs
+
+
 @given(st.one_of(st.integers(), st.text()))
 def test_list_cons_head(value: Any):
     x = pipe(frozenlist.empty.cons(value), frozenlist.head)
@@ -112,12 +151,87 @@ def test_list_pipe_mapi(xs: List[int]):
     assert [z for z in zs] == [x + i for i, x in enumerate(xs)]
 
 
+@given(st.integers())
+def test_list_of_option(x: int):
+    assert list(frozenlist.of_option(Some(x))) == [x]
+    assert frozenlist.of_option(Nothing).is_empty()
+
+
+@given(st.lists(st.integers()))
+def test_list_pipe_choose(xs: List[int]):
+    def chooser(x: int) -> Option[int]:
+        return Some(x * 10) if x > 0 else Nothing
+
+    ys = frozenlist.of_seq(xs)
+    zs = ys.pipe(frozenlist.choose(chooser))
+
+    assert isinstance(zs, FrozenList)
+    assert list(zs) == [x * 10 for x in xs if x > 0]
+
+
 @given(st.lists(st.integers()))
 def test_list_len(xs: List[int]):
     ys = frozenlist.of_seq(xs)
     assert len(xs) == len(ys)
 
 
+@given(
+    st.integers(min_value=-100, max_value=100),
+    st.integers(min_value=-100, max_value=100),
+    st.integers(min_value=1, max_value=10),
+)
+def test_list_range(start: int, stop: int, step: int):
+    assert list(frozenlist.range(stop)) == list(range(stop))
+    assert list(frozenlist.range(start, stop, step)) == list(range(start, stop, step))
+
+
+@given(st.lists(st.integers()))
+def test_list_to_seq(xs: List[int]):
+    ys = frozenlist.of_seq(xs)
+    zs = pipe(ys, frozenlist.to_seq)
+
+    assert list(zs.map(lambda x: x * 2)) == [x * 2 for x in xs]
+    assert zs.to_list() == ys
+
+
+def test_list_to_seq_is_lazy():
+    seen: List[int] = []
+
+    def mapper(x: int) -> int:
+        seen.append(x)
+        return x
+
+    xs = frozenlist.range(100)
+    assert xs.to_seq().map(mapper).head() == 0
+    assert seen == [0]
+
+
+@given(st.lists(st.integers()), st.lists(st.integers()))
+def test_list_equality(xs: List[int], ys: List[int]):
+    fx = frozenlist.of_seq(xs)
+    fy = frozenlist.of_seq(ys)
+
+    assert fx == frozenlist.of_seq(xs)
+    assert (fx == fy) == (xs == ys)
+
+
+@given(st.lists(st.integers()))
+def test_list_hash(xs: List[int]):
+    fx = frozenlist.of_seq(xs)
+    fy = frozenlist.of_seq(list(xs))
+
+    assert hash(fx) == hash(fy)
+    assert {fx: 42}[fy] == 42
+
+
+@given(st.lists(st.lists(st.integers())))
+def test_list_concat(xss: List[List[int]]):
+    expected = [x for xs in xss for x in xs]
+    ys = frozenlist.concat(frozenlist.of_seq(xs) for xs in xss)
+
+    assert list(ys) == expected
+
+
 @given(st.lists(st.integers()), st.lists(st.integers()))
 def test_list_append(xs: List[int], ys: List[int]):
     expected = xs + ys
@@ -129,6 +243,17 @@ def test_list_append(xs: List[int], ys: List[int]):
     assert list(fz) == list(fh) == expected
 
 
+@given(st.lists(st.integers()), st.lists(st.integers()), st.lists(st.integers()))
+def test_list_append_many(xs: List[int], ys: List[int], zs: List[int]):
+    expected = xs + ys + zs
+    fx = frozenlist.of_seq(xs)
+    fy = frozenlist.of_seq(ys)
+    fz = frozenlist.of_seq(zs)
+
+    assert list(fx.append(fy, fz)) == expected
+    assert fx.append() is fx
+
+
 @given(st.lists(st.integers()), st.integers(min_value=0))
 def test_list_take(xs: List[int], x: int):
     ys: FrozenList[int]
@@ -141,7 +266,7 @@ def test_list_take(xs: List[int], x: int):
 
 @given(st.lists(st.integers()), st.integers(min_value=0))
 def test_list_take_last(xs: List[int], x: int):
-    expected = xs[-x:]
+    expected = xs[len(xs) - x :] if x < len(xs) else xs
     ys: FrozenList[int]
     ys = frozenlist.of_seq(xs).take_last(x)
     assert list(ys) == expected
@@ -159,7 +284,7 @@ def test_list_skip(xs: List[int], x: int):
 
 @given(st.lists(st.integers()), st.integers(min_value=0))
 def test_list_skip_last(xs: List[int], x: int):
-    expected = xs[:-x]
+    expected = xs[: max(len(xs) - x, 0)]
     ys: FrozenList[int]
     ys = frozenlist.of_seq(xs).skip_last(x)
     assert list(ys) == expected
@@ -172,6 +297,7 @@ def test_list_slice(xs: List[int], x: int, y: int):
     ys: FrozenList[int] = frozenlist.of_seq(xs)
     zs = ys[x:y]
 
+    assert isinstance(zs, FrozenList)
     assert list(zs) == expected
 
 
@@ -216,6 +342,17 @@ def test_list_fold(xs: List[int]):
     assert result == expected
 
 
+@given(st.lists(st.integers()))
+def test_list_fold_back(xs: List[int]):
+    def folder(x: int, acc: List[int]) -> List[int]:
+        return [x] + acc
+
+    ys: FrozenList[int] = frozenlist.of_seq(xs)
+    result = frozenlist.fold_back(folder, ys)([])
+
+    assert result == xs
+
+
 @given(st.integers(max_value=100))
 def test_list_unfold(x: int):
     def unfolder(state: int) -> Option[Tuple[int, int]]: